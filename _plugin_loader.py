@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+_plugin_loader.py
+
+app_shell.py / app_web.py 共通のプラグイン読み込み処理。
+  - plugins/*.py（"_" 始まりを除く）を順に読み込み、モジュールオブジェクトを返す
+  - (パス, st_mtime_ns) が前回と同じなら exec_module を省略してキャッシュを再利用
+  - 消えたプラグインファイルはキャッシュと sys.modules から取り除く
+  - scan() で class Plugin の name / icon を AST から読み、import を後回しにできる
+"""
+import ast
+import sys
+import importlib.machinery
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+# まだ import されていない標準ライブラリ名も sys.modules に登録しない（3.10 未満は空）
+_STDLIB_NAMES = frozenset(getattr(sys, "stdlib_module_names", ()))
+
+
+class PluginLoader:
+    def __init__(self, plugins_dir: Path):
+        self.plugins_dir = Path(plugins_dir)
+        self._plugin_cache: dict[Path, tuple[int, ModuleType]] = {}
+        self._dir_mtime: int | None = None
+        self._files: list[Path] = []
+        self._marker_cache: dict[tuple[Path, bytes], tuple[int, bool]] = {}
+        self._scan_cache: dict[Path, tuple[int, dict[str, str] | None]] = {}
+        # plugins/ 専用の FileFinder（.py だけを SourceFileLoader で探す）を使い回す
+        self._finder = importlib.machinery.FileFinder(
+            str(self.plugins_dir), (importlib.machinery.SourceFileLoader, [".py"]))
+
+    def plugin_files(self) -> list[Path]:
+        # ディレクトリの mtime が変わったときだけ一覧を取り直す（"_" 始まりは対象外）
+        dir_mtime = self.plugins_dir.stat().st_mtime_ns
+        if dir_mtime != self._dir_mtime:
+            self._files = sorted((p for p in self.plugins_dir.iterdir()
+                                  if p.suffix == ".py" and not p.name.startswith("_")),
+                                 key=lambda p: p.name)
+            self._dir_mtime = dir_mtime
+            self._finder.invalidate_caches()
+        return self._files
+
+    def signature(self) -> tuple[tuple[str, int], ...]:
+        # 変更検知用: (パス, st_mtime_ns) の並び。追加・削除・更新のいずれでも値が変わる
+        return tuple((str(p), p.stat().st_mtime_ns) for p in self.plugin_files())
+
+    def load_modules(self, on_error: Callable[[Path, Exception], None] | None = None,
+                     marker: bytes | None = None) -> list[ModuleType]:
+        """marker を渡すと、その文字列をソースに含まないファイルは exec せずに読み飛ばす"""
+        modules: list[ModuleType] = []
+        for file in self.plugin_files():
+            try:
+                if marker is not None and not self._contains(file, marker):
+                    continue
+                module = self.load_module(file)
+            except Exception as e:
+                if on_error:
+                    on_error(file, e)
+                continue
+            if module is not None:
+                modules.append(module)
+        self.prune()
+        return modules
+
+    def prune(self) -> None:
+        # 削除されたプラグインを掃除
+        alive = set(self._files)
+        for stale in [p for p in self._plugin_cache if p not in alive]:
+            _, module = self._plugin_cache.pop(stale)
+            if sys.modules.get(stale.stem) is module:
+                del sys.modules[stale.stem]
+        for key in [k for k in self._marker_cache if k[0] not in alive]:
+            del self._marker_cache[key]
+        for stale in [p for p in self._scan_cache if p not in alive]:
+            del self._scan_cache[stale]
+
+    def scan(self, file: Path) -> dict[str, str] | None:
+        """
+        exec せずに class Plugin の name / icon を読む。
+        どちらも文字列リテラルで、mount もクラス本体に定義されている場合だけ dict を返す。
+        静的に決まらなければ None（呼び出し側は通常の import にフォールバックする）
+        """
+        mtime = file.stat().st_mtime_ns
+        cached = self._scan_cache.get(file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            tree = ast.parse(file.read_bytes(), filename=str(file))
+        except (SyntaxError, ValueError):
+            tree = None
+        meta = _plugin_meta(tree) if tree is not None else None
+        self._scan_cache[file] = (mtime, meta)
+        return meta
+
+    def _contains(self, file: Path, marker: bytes) -> bool:
+        mtime = file.stat().st_mtime_ns
+        cached = self._marker_cache.get((file, marker))
+        if cached and cached[0] == mtime:
+            return cached[1]
+        found = marker in file.read_bytes()
+        self._marker_cache[(file, marker)] = (mtime, found)
+        return found
+
+    def load_module(self, file: Path) -> ModuleType | None:
+        mtime = file.stat().st_mtime_ns
+        cached = self._plugin_cache.get(file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        spec = self._finder.find_spec(file.stem)
+        if spec is None or spec.origin != str(file):
+            # 同名のパッケージ（ディレクトリ）が優先された場合や、"my.plugin.py" のように
+            # stem にドットを含んで FileFinder で引けない場合はファイルを直接指定する
+            spec = importlib.util.spec_from_file_location(file.stem, file)
+        if not spec or not spec.loader:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        # exec 前に登録しておくと、プラグイン同士の import が解決できる。
+        # ただし既存のモジュール（標準ライブラリなど）を上書きしないよう、名前が空いているか
+        # このファイルの前回分が入っているときだけ登録する
+        current = sys.modules.get(file.stem)
+        register = (current is None and file.stem not in _STDLIB_NAMES) or \
+            (cached is not None and current is cached[1])
+        if register:
+            sys.modules[file.stem] = module
+        try:
+            spec.loader.exec_module(module)  # type: ignore
+        except Exception:
+            if register and sys.modules.get(file.stem) is module:
+                del sys.modules[file.stem]
+            self._plugin_cache.pop(file, None)
+            raise
+        self._plugin_cache[file] = (mtime, module)
+        return module
+
+
+def _plugin_meta(tree: ast.Module) -> dict[str, str] | None:
+    cls = None
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "Plugin":
+            cls = node  # 後に定義されたものが有効
+    if cls is None:
+        return None
+
+    meta: dict[str, str] = {}
+    has_mount = False
+    for stmt in cls.body:
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)) and stmt.name == "mount":
+            has_mount = True
+            continue
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+            target, value = stmt.targets[0], stmt.value
+        elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+            target, value = stmt.target, stmt.value
+        else:
+            continue
+        if isinstance(target, ast.Name) and target.id in ("name", "icon"):
+            if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                meta[target.id] = value.value
+            else:
+                meta.pop(target.id, None)
+    if not has_mount or len(meta) != 2:
+        return None
+    return meta
+
+
+_shared_loaders: dict[Path, PluginLoader] = {}
+
+
+def shared_loader(plugins_dir: Path) -> PluginLoader:
+    """プロセス内で共有するローダー（Streamlit の再実行をまたいでキャッシュを保持する）"""
+    key = Path(plugins_dir).resolve()
+    loader = _shared_loaders.get(key)
+    if loader is None:
+        loader = _shared_loaders[key] = PluginLoader(key)
+    return loader
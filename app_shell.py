@@ -9,19 +9,34 @@ app_shell.py
 """
 import os
 import sys
-import importlib.util
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import time
 import platform
 import webbrowser
 import subprocess
 
+from _plugin_loader import PluginLoader
+
 APP_NAME = "Plugin Shell"
 APP_DESC = "モード切替型プラグイン・アプリケーションのシェル"
 PLUGINS_DIRNAME = "plugins"
 
+# フォルダを開くコマンド（OS 判定は起動時に1回だけ）
+_SYSTEM = platform.system()
+
+
+def _xdg_open(p: str) -> None:
+    subprocess.run(["xdg-open", p])
+
+
+_OPENERS = {
+    "Windows": lambda p: os.startfile(p),  # type: ignore
+    "Darwin": lambda p: subprocess.run(["open", p]),
+}
+
 # ---------------------------
 # プラグイン基底クラス（仕様）
 # ---------------------------
@@ -35,6 +50,7 @@ class PluginBase:
     """
     name: str = "Unnamed"
     icon: str = "🔧"
+    _mode_label_text: str = ""  # リボンボタンの表示文字列（シェルが設定）
 
     def __init__(self, shell_context: dict | None = None) -> None:
         self.shell_context = shell_context or {}
@@ -46,6 +62,38 @@ class PluginBase:
         pass
 
 
+class _LazyPlugin(PluginBase):
+    """
+    リボン表示用の軽量プロキシ。name / icon は AST から読んだ値を持ち、
+    最初に mount() されたときに本物のプラグインを import してインスタンス化する。
+    """
+
+    def __init__(self, loader: PluginLoader, file: Path, meta: dict[str, str],
+                 shell_context: dict | None = None) -> None:
+        super().__init__(shell_context)
+        self.name = meta["name"]
+        self.icon = meta["icon"]
+        self._loader = loader
+        self._file = file
+        self._instance: PluginBase | None = None
+
+    def load(self) -> PluginBase:
+        if self._instance is None:
+            module = self._loader.load_module(self._file)
+            cls = getattr(module, "Plugin", None)
+            if not (isinstance(cls, type) and issubclass(cls, PluginBase)):
+                raise TypeError(f"{self._file.name} に PluginBase を継承した class Plugin がありません。")
+            self._instance = cls(shell_context=self.shell_context)
+        return self._instance
+
+    def mount(self, parent: tk.Frame) -> None:
+        self.load().mount(parent)
+
+    def unmount(self) -> None:
+        if self._instance is not None:
+            self._instance.unmount()
+
+
 # ---------------------------
 # シェル（UIフレーム）
 # ---------------------------
@@ -63,6 +111,14 @@ class ShellApp:
         self.plugins_dir.mkdir(exist_ok=True)
         self.plugins: list[PluginBase] = []
         self.current_plugin: PluginBase | None = None
+        self._loader = PluginLoader(self.plugins_dir)
+        self._plugins_sig = None
+        self._grad_after = None
+        self._btns_after = None
+        self._status_suffix = "Ready"
+        self._last_clock_str = ""
+        self._clock_anchor = time.monotonic()
+        self._tick_after = None
 
         # スタイル
         self._init_style()
@@ -84,8 +140,10 @@ class ShellApp:
         # 初期: プラグイン読み込み
         self.reload_plugins()
 
-        # ステータスバー更新タイマー
-        self._tick_clock()
+        # ステータスバー更新タイマー（最小化中は止めて、無駄に起こさない）
+        self.root.bind("<Map>", lambda e: self._start_clock() if e.widget is self.root else None, add="+")
+        self.root.bind("<Unmap>", lambda e: self._stop_clock() if e.widget is self.root else None, add="+")
+        self._start_clock()
 
     # ---------- STYLE ----------
     def _init_style(self):
@@ -107,24 +165,46 @@ class ShellApp:
         self.c_acc = "#10b981"       # アクセント（緑）
         self.c_warn = "#ef4444"      # 警告（赤）
 
-        # ラベル系
-        style.configure("HdrTitle.TLabel", font=("Yu Gothic UI", 18, "bold"), foreground=self.c_hdr_text, background=self.c_hdr_bot)
-        style.configure("HdrSub.TLabel", font=("Yu Gothic UI", 9), foreground="#e6f0ff", background=self.c_hdr_bot)
-        style.configure("HdrMode.TLabel", font=("Consolas", 10, "bold"), foreground="#e6f0ff", background=self.c_hdr_bot)
+        # ヘッダーのグラデーション画像（1度だけ生成して使い回す）
+        self._grad_hex = self._gradient_colors(self.c_hdr_top, self.c_hdr_bot, 84)
+        self._hdr_grad_img = self._build_gradient_image(self.root.winfo_screenwidth())
+        self._last_hdr_w = None
+        self._grad_item = None
+
+        # フォント（同じ指定は1つの Font を共有する）
+        ui = "Yu Gothic UI"
+        self._f_hdr_title = tkfont.Font(family=ui, size=18, weight="bold")
+        self._f_card_title = tkfont.Font(family=ui, size=13, weight="bold")
+        self._f_ribbon_head = tkfont.Font(family=ui, size=12, weight="bold")
+        self._f_title = tkfont.Font(family=ui, size=11, weight="bold")
+        self._f_body = tkfont.Font(family=ui, size=10)
+        self._f_small = tkfont.Font(family=ui, size=9)
+        self._f_mode = tkfont.Font(family="Consolas", size=10, weight="bold")
+        self._f_mono = tkfont.Font(family="Consolas", size=9)
+
+        specs = {
+            # ラベル系
+            "HdrTitle.TLabel": dict(font=self._f_hdr_title, foreground=self.c_hdr_text, background=self.c_hdr_bot),
+            "HdrSub.TLabel": dict(font=self._f_small, foreground="#e6f0ff", background=self.c_hdr_bot),
+            "HdrMode.TLabel": dict(font=self._f_mode, foreground="#e6f0ff", background=self.c_hdr_bot),
+
+            "Ribbon.TFrame": dict(background=self.c_ribbon_bg),
+            "RibbonTitle.TLabel": dict(font=self._f_title, foreground="#1f2937", background=self.c_ribbon_bg),
+            "RibbonMuted.TLabel": dict(font=self._f_small, foreground=self.c_muted, background=self.c_ribbon_bg),
+
+            "Card.TFrame": dict(background=self.c_card),
+            "CardTitle.TLabel": dict(font=self._f_card_title, background=self.c_card, foreground="#111827"),
+            "CardText.TLabel": dict(font=self._f_body, background=self.c_card, foreground=self.c_muted),
+
+            "BigAction.TButton": dict(font=self._f_title),
+            "Ghost.TButton": dict(font=self._f_body),
+
+            # リボンボタン（丸みのあるフラット）
+            "Ribbon.TButton": dict(font=self._f_title, padding=10),
+        }
+        for name, opts in specs.items():
+            style.configure(name, **opts)
 
-        style.configure("Ribbon.TFrame", background=self.c_ribbon_bg)
-        style.configure("RibbonTitle.TLabel", font=("Yu Gothic UI", 11, "bold"), foreground="#1f2937", background=self.c_ribbon_bg)
-        style.configure("RibbonMuted.TLabel", font=("Yu Gothic UI", 9), foreground=self.c_muted, background=self.c_ribbon_bg)
-
-        style.configure("Card.TFrame", background=self.c_card)
-        style.configure("CardTitle.TLabel", font=("Yu Gothic UI", 13, "bold"), background=self.c_card, foreground="#111827")
-        style.configure("CardText.TLabel", font=("Yu Gothic UI", 10), background=self.c_card, foreground=self.c_muted)
-
-        style.configure("BigAction.TButton", font=("Yu Gothic UI", 11, "bold"))
-        style.configure("Ghost.TButton", font=("Yu Gothic UI", 10))
-
-        # リボンボタン（丸みのあるフラット）
-        style.configure("Ribbon.TButton", font=("Yu Gothic UI", 11, "bold"), padding=10)
         style.map("Ribbon.TButton",
                   background=[("active", "#e0ebff")],
                   relief=[("pressed", "sunken"), ("!pressed", "flat")])
@@ -137,9 +217,9 @@ class ShellApp:
         self._draw_header_gradient()
 
         # タイトル＆モード名
-        self.hdr_title = tk.Label(self.header, text=f"✨ {APP_NAME}", font=("Yu Gothic UI", 18, "bold"), fg=self.c_hdr_text, bg=self.c_hdr_bot)
-        self.hdr_desc  = tk.Label(self.header, text=APP_DESC, font=("Yu Gothic UI", 9), fg="#e6f0ff", bg=self.c_hdr_bot)
-        self.hdr_mode  = tk.Label(self.header, text="CURRENT MODE: —", font=("Consolas", 10, "bold"), fg="#e6f0ff", bg=self.c_hdr_bot)
+        self.hdr_title = tk.Label(self.header, text=f"✨ {APP_NAME}", font=self._f_hdr_title, fg=self.c_hdr_text, bg=self.c_hdr_bot)
+        self.hdr_desc  = tk.Label(self.header, text=APP_DESC, font=self._f_small, fg="#e6f0ff", bg=self.c_hdr_bot)
+        self.hdr_mode  = tk.Label(self.header, text="CURRENT MODE: —", font=self._f_mode, fg="#e6f0ff", bg=self.c_hdr_bot)
 
         # 右上: ヘルプ／プラグインフォルダ／再読み込み
         self.hdr_btns = tk.Frame(self.header, bg=self.c_hdr_bot)
@@ -149,20 +229,43 @@ class ShellApp:
         self.header.create_window(20, 50, window=self.hdr_desc, anchor="nw")
         self.header.create_window(320, 20, window=self.hdr_mode, anchor="nw")
         self.header.create_window(self.root.winfo_width() - 20, 18, window=self.hdr_btns, anchor="ne")
-        self.header.bind("<Configure>", lambda e: self._reposition_header_buttons())
+        self.header.bind("<Configure>", lambda e: self._schedule_header_buttons())
+
+    def _build_gradient_image(self, width: int) -> tk.PhotoImage:
+        # 1列分の色（上: c_hdr_top → 下: c_hdr_bot）を横方向に敷き詰める（Tcl 呼び出し1回）
+        height = len(self._grad_hex)
+        img = tk.PhotoImage(width=width, height=height)
+        img.put(" ".join(f"{{{c}}}" for c in self._grad_hex), to=(0, 0, width, height))
+        return img
 
     def _draw_header_gradient(self):
-        self.header.delete("grad")
+        self._grad_after = None
         w = max(self.header.winfo_width(), 600)
-        h = self.header.winfo_height() or 84
-        steps = 60
-        for i in range(steps):
-            r = i / max(steps - 1, 1)
-            # 簡易グラデーション（上: c_hdr_top → 下: c_hdr_bot）
-            color = self._lerp_color(self.c_hdr_top, self.c_hdr_bot, r)
-            self.header.create_rectangle(0, int(i * h / steps), w, int((i + 1) * h / steps), outline="", fill=color, tags="grad")
+        if w == self._last_hdr_w:
+            return
+        self._last_hdr_w = w
+        if self._grad_item is None:
+            # 背景画像のアイテムは1つだけ作り、以降は使い回す
+            self._grad_item = self.header.create_image(0, 0, image=self._hdr_grad_img, anchor="nw", tags="grad")
+            self.header.tag_lower(self._grad_item)
+        if w > self._hdr_grad_img.width():
+            # 画面幅より広がったときだけ画像を作り直して差し替える
+            self._hdr_grad_img = self._build_gradient_image(w)
+            self.header.itemconfigure(self._grad_item, image=self._hdr_grad_img)
+
+    def _schedule_grad_redraw(self):
+        # リサイズ中の連続イベントは最後の1回にまとめる
+        if self._grad_after:
+            self.root.after_cancel(self._grad_after)
+        self._grad_after = self.root.after(40, self._draw_header_gradient)
+
+    def _schedule_header_buttons(self):
+        if self._btns_after:
+            self.root.after_cancel(self._btns_after)
+        self._btns_after = self.root.after(40, self._reposition_header_buttons)
 
     def _reposition_header_buttons(self):
+        self._btns_after = None
         self.header.delete("btns")
         self.header.create_window(self.header.winfo_width() - 20, 18, window=self.hdr_btns, anchor="ne", tags="btns")
 
@@ -175,13 +278,16 @@ class ShellApp:
     def _rgb_to_hex(rgb: tuple[int,int,int]):
         return f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
 
-    def _lerp_color(self, c1: str, c2: str, t: float) -> str:
-        r1,g1,b1 = self._hex_to_rgb(c1)
-        r2,g2,b2 = self._hex_to_rgb(c2)
-        r = int(r1 + (r2 - r1) * t)
-        g = int(g1 + (g2 - g1) * t)
-        b = int(b1 + (b2 - b1) * t)
-        return self._rgb_to_hex((r,g,b))
+    @classmethod
+    def _gradient_colors(cls, c1: str, c2: str, steps: int) -> list[str]:
+        # 端点の色は1回だけ解析し、各段の色をまとめて求める
+        r1,g1,b1 = cls._hex_to_rgb(c1)
+        r2,g2,b2 = cls._hex_to_rgb(c2)
+        colors = []
+        for i in range(steps):
+            t = i / max(steps - 1, 1)
+            colors.append(cls._rgb_to_hex((int(r1 + (r2 - r1) * t), int(g1 + (g2 - g1) * t), int(b1 + (b2 - b1) * t))))
+        return colors
 
     def _build_header_actions(self):
         for w in self.hdr_btns.winfo_children():
@@ -197,7 +303,7 @@ class ShellApp:
         btn("❔ ヘルプ", self.open_help)
 
         # ステータス（右下）
-        self.statusbar = tk.Label(self.root, text="—", anchor="e", bg=self.c_bg, fg="#4b5563", font=("Consolas", 9))
+        self.statusbar = tk.Label(self.root, text="—", anchor="e", bg=self.c_bg, fg="#4b5563", font=self._f_mono)
         self.statusbar.pack(fill="x", side="bottom", padx=14, pady=(0,6))
 
     # ---------- BODY ----------
@@ -220,10 +326,14 @@ class ShellApp:
         # 角丸っぽい影（簡易）
         self.work_card.configure(highlightbackground="#dbe3f2", highlightcolor="#dbe3f2", highlightthickness=1)
 
+        # 空状態ビューは1度だけ作り、プラグイン表示中は隠しておく
+        self._current_frame = None
+        self._build_empty_state()
+
     def _build_ribbon(self):
         # タイトル
         tk.Label(self.ribbon, text="モード（プラグイン）", bg=self.c_ribbon_bg, fg="#111827",
-                 font=("Yu Gothic UI", 12, "bold")).pack(anchor="w", padx=16, pady=(16, 2))
+                 font=self._f_ribbon_head).pack(anchor="w", padx=16, pady=(16, 2))
         ttk.Label(self.ribbon, text="左のボタンからモードを切替えます", style="RibbonMuted.TLabel").pack(anchor="w", padx=16, pady=(0, 12))
 
         # スクロール可能なボタン領域
@@ -241,6 +351,9 @@ class ShellApp:
         self.ribbon_canvas.pack(side="left", fill="both", expand=True)
         vsb.pack(side="right", fill="y")
 
+        # モードボタン（再読み込みでは破棄せず使い回す）
+        self._ribbon_btn_pool: list[ttk.Button] = []
+
         # “空”の時のプレースホルダ
         self.ribbon_empty = None
         self._mount_ribbon_empty()
@@ -252,16 +365,12 @@ class ShellApp:
         ttk.Button(bottom, text="🔄 再読み込み", style="Ghost.TButton", command=self.reload_plugins).pack(side="right")
 
     def _mount_ribbon_empty(self):
-        # 既存のプレースホルダがあれば破棄（壊れた参照対策）
-        if getattr(self, "ribbon_empty", None) is not None:
-            try:
-                if self.ribbon_empty.winfo_exists():
-                    self.ribbon_empty.destroy()
-            except Exception:
-                pass
-            self.ribbon_empty = None
+        # 表示中なら何もしない。初回だけ作り、以降は pack / pack_forget で出し入れする
+        if self.ribbon_empty is not None and self.ribbon_empty.winfo_exists():
+            if not self.ribbon_empty.winfo_manager():
+                self.ribbon_empty.pack(fill="both", expand=True, padx=8, pady=8)
+            return
 
-        # 新しく作り直す
         self.ribbon_empty = tk.Frame(self.ribbon_body, bg=self.c_ribbon_bg)
         self.ribbon_empty.pack(fill="both", expand=True, padx=8, pady=8)
 
@@ -269,30 +378,30 @@ class ShellApp:
         card.pack(fill="x", padx=4, pady=8)
 
         tk.Label(card, text="プラグインがありません", bg="#ffffff", fg="#111827",
-                 font=("Yu Gothic UI", 11, "bold")).pack(anchor="w", padx=10, pady=(10, 2))
+                 font=self._f_title).pack(anchor="w", padx=10, pady=(10, 2))
         tk.Label(card, text="plugins フォルダにプラグインを追加すると\nここにモードボタンが増えます。",
-                 bg="#ffffff", fg=self.c_muted, font=("Yu Gothic UI", 9), justify="left").pack(anchor="w", padx=10, pady=(0, 10))
-
-    def _clear_ribbon_buttons(self):
-        for child in list(self.ribbon_body.winfo_children()):
-            # 空カードは残さず全部消す
-            child.destroy()
-        self.ribbon_empty = None
-
-    def _add_ribbon_button(self, plugin: PluginBase):
-        btn = ttk.Button(self.ribbon_body,
-                         text=f"{getattr(plugin, 'icon', '🔹')}  {getattr(plugin, 'name', 'Unnamed')}",
-                         style="Ribbon.TButton",
-                         command=lambda p=plugin: self.switch_mode(p))
-        btn.pack(fill="x", padx=8, pady=6)
+                 bg="#ffffff", fg=self.c_muted, font=self._f_small, justify="left").pack(anchor="w", padx=10, pady=(0, 10))
+
+    def _sync_ribbon_buttons(self):
+        # ボタンは作り直さずプールから使い回す（余った分は隠すだけ）
+        if self.plugins and self.ribbon_empty is not None:
+            self.ribbon_empty.pack_forget()
+        pool = self._ribbon_btn_pool
+        for i, plugin in enumerate(self.plugins):
+            if i == len(pool):
+                pool.append(ttk.Button(self.ribbon_body, style="Ribbon.TButton"))
+            plugin._mode_label_text = f"{plugin.icon}  {plugin.name}"
+            pool[i].configure(text=plugin._mode_label_text, command=lambda p=plugin: self.switch_mode(p))
+            pool[i].pack(fill="x", padx=8, pady=6)
+        for btn in pool[len(self.plugins):]:
+            btn.pack_forget()
 
     # ---------- CONTENT (EMPTY STATE) ----------
-    def _mount_empty_state(self):
-        for w in self.work_card.winfo_children():
-            w.destroy()
+    def _build_empty_state(self):
+        self._empty_frame = tk.Frame(self.work_card, bg=self.c_card)
 
         # 右側の空状態ビュー
-        header = tk.Frame(self.work_card, bg=self.c_card)
+        header = tk.Frame(self._empty_frame, bg=self.c_card)
         header.pack(fill="x", padx=18, pady=(18, 8))
 
         ttk.Label(header, text="ようこそ！", style="CardTitle.TLabel").pack(anchor="w")
@@ -300,33 +409,46 @@ class ShellApp:
                   style="CardText.TLabel").pack(anchor="w", pady=(4, 6))
 
         # アクションライン
-        actions = tk.Frame(self.work_card, bg=self.c_card)
+        actions = tk.Frame(self._empty_frame, bg=self.c_card)
         actions.pack(fill="x", padx=18, pady=(2, 18))
 
         ttk.Button(actions, text="🧩 プラグインフォルダを開く", style="BigAction.TButton", command=self.open_plugins_folder).pack(side="left")
         ttk.Button(actions, text="🔄 プラグインを再読み込み", style="BigAction.TButton", command=self.reload_plugins).pack(side="left", padx=10)
 
         # 視覚カード（ヒント）
-        tips = tk.Frame(self.work_card, bg=self.c_card)
+        tips = tk.Frame(self._empty_frame, bg=self.c_card)
         tips.pack(fill="both", expand=True, padx=18, pady=(0, 18))
 
         tip_card = tk.Frame(tips, bg="#f8fafc", highlightbackground="#e5e7eb", highlightthickness=1)
         tip_card.pack(fill="both", expand=True)
 
         tk.Label(tip_card, text="プラグインの作り方（ざっくり）", bg="#f8fafc", fg="#0f172a",
-                 font=("Yu Gothic UI", 11, "bold")).pack(anchor="w", padx=14, pady=(12, 6))
+                 font=self._f_title).pack(anchor="w", padx=14, pady=(12, 6))
 
         msg = (
             "1) plugins/ に Python ファイルを置き、PluginBase を継承した class Plugin を実装\n"
             "2) name / icon / mount(parent) / unmount() を定義\n"
             "3) 保存後、左下の [再読み込み] を押すとボタンが追加されます\n"
         )
-        tk.Label(tip_card, text=msg, bg="#f8fafc", fg=self.c_muted, font=("Yu Gothic UI", 9), justify="left").pack(anchor="w", padx=14, pady=(0, 14))
+        tk.Label(tip_card, text=msg, bg="#f8fafc", fg=self.c_muted, font=self._f_small, justify="left").pack(anchor="w", padx=14, pady=(0, 14))
 
+    def _mount_empty_state(self):
+        # プラグイン用フレームを外して、作り置きの空状態ビューを表示
+        if self._current_frame is not None:
+            self._current_frame.destroy()
+            self._current_frame = None
+        if not self._empty_frame.winfo_manager():
+            self._empty_frame.pack(fill="both", expand=True)
         self._set_mode_label("—")
 
     # ---------- PLUGIN MGMT ----------
     def reload_plugins(self):
+        # plugins/ に変更が無ければ何もしない
+        sig = self._loader.signature()
+        if sig == self._plugins_sig:
+            self._set_status(f"プラグイン: {len(self.plugins)} 個（変更なし）")
+            return
+
         # 現プラグインのアンマウント
         if self.current_plugin:
             try:
@@ -337,26 +459,28 @@ class ShellApp:
 
         # 既存プラグイン破棄
         self.plugins.clear()
-        self._clear_ribbon_buttons()
 
-        # 読込
+        # 読込（name / icon が静的に読めるものは import を初回マウントまで遅らせる）
         found = 0
-        for file in sorted(self.plugins_dir.glob("*.py")):
+        ctx = {"base_dir": str(self.base_dir)}
+        for file in self._loader.plugin_files():
             try:
-                spec = importlib.util.spec_from_file_location(file.stem, file)
-                if not spec or not spec.loader:
+                meta = self._loader.scan(file)
+                if meta is not None:
+                    self.plugins.append(_LazyPlugin(self._loader, file, meta, shell_context=dict(ctx)))
+                    found += 1
                     continue
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)  # type: ignore
+                module = self._loader.load_module(file)
                 if hasattr(module, "Plugin"):
                     cls = getattr(module, "Plugin")
                     if issubclass(cls, PluginBase):
-                        instance = cls(shell_context={"base_dir": str(self.base_dir)})
+                        instance = cls(shell_context=dict(ctx))
                         self.plugins.append(instance)
-                        self._add_ribbon_button(instance)
                         found += 1
             except Exception as e:
                 print(f"[WARN] failed to load plugin {file.name}: {e}")
+        self._loader.prune()
+        self._sync_ribbon_buttons()
 
         if found == 0:
             self._mount_ribbon_empty()
@@ -366,6 +490,7 @@ class ShellApp:
             # self.switch_mode(self.plugins[0])
             pass
 
+        self._plugins_sig = sig
         self._set_status(f"プラグイン: {found} 個")
         self._draw_header_gradient()  # サイズ変化時に再描画
 
@@ -377,16 +502,19 @@ class ShellApp:
             except Exception:
                 pass
 
-        # 作業領域クリア
-        for w in self.work_card.winfo_children():
-            w.destroy()
+        # 作業領域クリア（プラグインは毎回新しい子フレームにマウントする）
+        if self._current_frame is not None:
+            self._current_frame.destroy()
+        self._empty_frame.pack_forget()
+        self._current_frame = tk.Frame(self.work_card, bg=self.c_card)
+        self._current_frame.pack(fill="both", expand=True)
 
         # 新プラグインをマウント
         try:
-            plugin.mount(self.work_card)
+            plugin.mount(self._current_frame)
             self.current_plugin = plugin
-            self._set_mode_label(getattr(plugin, "name", "—"))
-            self._set_status(f"現在のモード: {getattr(plugin, 'name', '')}")
+            self._set_mode_label(plugin.name)
+            self._set_status(f"現在のモード: {plugin.name}")
         except Exception as e:
             messagebox.showerror(APP_NAME, f"プラグインのマウントに失敗しました。\n{e}")
             self._mount_empty_state()
@@ -395,12 +523,7 @@ class ShellApp:
     def open_plugins_folder(self):
         p = str(self.plugins_dir.resolve())
         try:
-            if platform.system() == "Windows":
-                os.startfile(p)  # type: ignore
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", p])
-            else:
-                subprocess.run(["xdg-open", p])
+            _OPENERS.get(_SYSTEM, _xdg_open)(p)
         except Exception:
             messagebox.showinfo(APP_NAME, f"プラグインフォルダ: {p}")
 
@@ -415,25 +538,38 @@ class ShellApp:
         self.hdr_mode.configure(text=f"CURRENT MODE: {mode}")
 
     def _set_status(self, text: str):
-        self.statusbar.configure(text=f"{time.strftime('%H:%M:%S')}  {text}")
+        self._status_suffix = text
+        self._render_status(force=True)
+
+    def _render_status(self, force: bool = False):
+        now = time.strftime("%H:%M:%S")
+        if not force and now == self._last_clock_str:
+            return
+        self._last_clock_str = now
+        self.statusbar.configure(text=f"{now}  {self._status_suffix}")
+
+    def _start_clock(self):
+        if self._tick_after is None:
+            self._tick_clock()
+
+    def _stop_clock(self):
+        if self._tick_after is not None:
+            self.root.after_cancel(self._tick_after)
+            self._tick_after = None
 
     def _tick_clock(self):
         # 時計（と軽い“生きてる”感）の更新
-        now = time.strftime("%H:%M:%S")
-        cur = self.statusbar.cget("text")
-        if "  " in cur:
-            suffix = cur.split("  ", 1)[1]
-        else:
-            suffix = "Ready"
-        self.statusbar.configure(text=f"{now}  {suffix}")
-        self.root.after(1000, self._tick_clock)
+        self._render_status()
+        # 起動時刻を基準に次の秒境界へ合わせる（after(1000) の積み重ねでずれないように）
+        elapsed_ms = int((time.monotonic() - self._clock_anchor) * 1000)
+        self._tick_after = self.root.after(1000 - elapsed_ms % 1000, self._tick_clock)
 
 
 def main():
     root = tk.Tk()
     app = ShellApp(root)
     # ウィンドウサイズ変更に合わせてヘッダーグラデを再描画
-    root.bind("<Configure>", lambda e: app._draw_header_gradient() if e.widget is root else None)
+    root.bind("<Configure>", lambda e: app._schedule_grad_redraw() if e.widget is root else None)
     root.mainloop()
 
 
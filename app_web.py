@@ -1,43 +1,48 @@
 # app_web.py  — Streamlit 版エントリ
-import importlib.util
 from pathlib import Path
 import streamlit as st
 
+from _plugin_loader import shared_loader
+
 PLUGINS_DIR = Path(__file__).parent / "plugins"
 
 st.set_page_config(page_title="Plugin Shell (Web)", layout="wide")
 st.title("🔌 Plugin Shell (Web)")
 st.caption("Streamlit 版。plugins/ に web_mount(st) を持つプラグインだけを表示します。")
 
-def load_web_plugins():
+@st.cache_resource(show_spinner=False)
+def load_web_plugins(signature: tuple[tuple[str, int], ...]):
+    # signature（各ファイルの (パス, st_mtime_ns)）が変わったときだけ読み直す
     plugins = []
-    PLUGINS_DIR.mkdir(exist_ok=True)
-    for py in sorted(PLUGINS_DIR.glob("*.py")):
+    try:
+        from app_shell import PluginBase  # ルートにある前提（ループの外で1回だけ解決）
+    except Exception as e:
+        st.warning(f"Failed to import PluginBase: {e}")
+        return plugins, []
+    loader = shared_loader(PLUGINS_DIR)
+    # web_mount を含まないファイル（Tk 専用プラグイン）は exec しない
+    for module in loader.load_modules(on_error=lambda py, e: st.warning(f"Failed to load {py.name}: {e}"),
+                                      marker=b"web_mount"):
         try:
-            spec = importlib.util.spec_from_file_location(py.stem, py)
-            if not spec or not spec.loader:
-                continue
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)  # type: ignore
             if hasattr(module, "Plugin"):
-                from app_shell import PluginBase  # ルートにある前提
                 Plugin = getattr(module, "Plugin")
                 if issubclass(Plugin, PluginBase):
                     inst = Plugin(shell_context={"base_dir": str(Path(__file__).parent)})
                     if hasattr(inst, "web_mount"):
                         plugins.append(inst)
         except Exception as e:
-            st.warning(f"Failed to load {py.name}: {e}")
-    return plugins
+            st.warning(f"Failed to load {module.__name__}: {e}")
+    names = [getattr(p, "name", "Unnamed") for p in plugins]
+    return plugins, names
 
-plugins = load_web_plugins()
-names = [getattr(p, "name", "Unnamed") for p in plugins]
+PLUGINS_DIR.mkdir(exist_ok=True)
+plugins, names = load_web_plugins(shared_loader(PLUGINS_DIR).signature())
 
 left, right = st.columns([1, 3], gap="large")
 with left:
     if not plugins:
         st.info("plugins/ に web_mount() を実装したプラグインを置くとここに出ます。")
-    idx = st.radio("プラグイン", options=list(range(len(plugins))), format_func=lambda i: names[i]) if plugins else None
+    idx = st.radio("プラグイン", options=list(range(len(plugins))), format_func=names.__getitem__) if plugins else None
 
 with right:
     if idx is not None:
@@ -5,13 +5,24 @@ Excel 整形プラグイン（Plugin Shell 用）
 - デスクトップ(Tk)では mount() を使い、Web(Streamlit/Render)では web_mount() を使う
 - Tk が無い環境でも import 可能なように、tkinter は条件付きインポート
 - デスクトップでは app_shell.py の PluginBase と“同一オブジェクト”を継承
+- 整形は Excel(COM) か openpyxl のどちらかで行う（画面のチェックで切り替え）
 """
 
 from __future__ import annotations
+import re
 import sys
+import copy
 import json
+import html
+import zipfile
 import unicodedata
 import shutil
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
 from typing import Optional
 
@@ -51,211 +62,756 @@ except Exception:
 # ---- Excel COM（デスクトップ専用）----
 try:
     import win32com.client as win32  # type: ignore
+    import pythoncom  # type: ignore
 except Exception:
     win32 = None
+    pythoncom = None
+
+# ---- JSON 読み込みの高速化（任意: pip install orjson）----
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+# ---- 会社名置換の高速化（任意: pip install pyahocorasick）----
+try:
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None
+
+# ---- ローマ字変換の JIT（任意: pip install numba）----
+try:
+    import numpy as np  # type: ignore
+    from numba import njit  # type: ignore
+except Exception:
+    np = None
+    njit = None
 
 # ==== 定数 ====
 TEMPLATE_XLSX_ORIGINAL = "Attendee_format_original.xlsx"
 ROMAJI_JSON = "romaji_mapping.json"
+# company_replacements.json: [{"patterns": ["株式会社", "(株)"], "replacement": "Co., Ltd."}, ...]
+#   - 全セルの文字列を部分一致で置換する。大文字小文字・全角/半角（"(株)" と "（株）" など）は区別しない
+#   - 全パターンを1回で走査し、同じ位置から複数のパターンが当たる場合は長いものを採用する
+#     （同じパターンが複数のルールにあれば先のルールが優先）
+#   - 置換結果に別のルールを重ねて当てることはしない（ルール間で連鎖しない）
 COMPANY_JSON = "company_replacements.json"
 DATA_SHEET = "DATA"
 OUTPUTS_SHEET = "Outputs"
 
 # ==== ユーティリティ ====
+# ひらがな(U+3041..U+3096) → カタカナ(+0x60) の変換表
+_HIRA2KATA = {cp: cp + 0x60 for cp in range(0x3041, 0x3097)}
+
 def _to_zen_katakana(s):
     if s is None:
         return None
-    t = unicodedata.normalize("NFKC", str(s))
-    res = []
-    for ch in t:
-        code = ord(ch)
-        if 0x3041 <= code <= 0x3096:  # ひらがな→カタカナ
-            res.append(chr(code + 0x60))
-        else:
-            res.append(ch)
-    return "".join(res)
+    return unicodedata.normalize("NFKC", str(s)).translate(_HIRA2KATA)
+
+_KANA_BASE = 0x30A0  # カタカナブロック U+30A0..U+30FF（96 文字）
+
+class _RomajiTable:
+    """
+    digraphs（2文字）と mono（1文字）を最長一致で引くための表。
+    カタカナブロック内の文字は「コードポイント - 0x30A0」で引ける 96 要素のリスト
+    （digraph は 96×96 の2段）にしておき、ハッシュもスライスも使わずに判定する。
+    ブロック外の文字を含むキーだけは dict に残す。
+    """
+
+    def __init__(self, digraphs, mono):
+        self.mono: list[str | None] = [None] * 96
+        self.pairs: list[list[str | None] | None] = [None] * 96
+        self.extra_mono: dict[str, str] = {}
+        self.extra_pairs: dict[str, str] = {}
+        for k, v in mono.items():
+            c = ord(k) - _KANA_BASE if len(k) == 1 else -1
+            if 0 <= c < 96:
+                self.mono[c] = v
+            else:
+                self.extra_mono[k] = v
+        for k, v in digraphs.items():
+            if len(k) != 2:
+                continue
+            c1, c2 = ord(k[0]) - _KANA_BASE, ord(k[1]) - _KANA_BASE
+            if 0 <= c1 < 96 and 0 <= c2 < 96:
+                row = self.pairs[c1]
+                if row is None:
+                    row = self.pairs[c1] = [None] * 96
+                row[c2] = v
+            else:
+                self.extra_pairs[k] = v
+        # ブロック外のキーがあると配列に載らないので、その場合は Python 版で回す
+        self.jit = (_RomajiJit(self) if _roma_kernel is not None
+                    and not self.extra_mono and not self.extra_pairs else None)
+
+    def match(self, s: str, i: int):
+        """位置 i からの最長一致を (消費文字数, ローマ字 or None) で返す"""
+        c1 = ord(s[i]) - _KANA_BASE
+        if i + 1 < len(s):
+            c2 = ord(s[i + 1]) - _KANA_BASE
+            if 0 <= c1 < 96 and 0 <= c2 < 96:
+                row = self.pairs[c1]
+                roma = row[c2] if row is not None else None
+            else:
+                roma = self.extra_pairs.get(s[i:i + 2]) if self.extra_pairs else None
+            if roma is not None:
+                return 2, roma
+        if 0 <= c1 < 96:
+            return 1, self.mono[c1]
+        return 1, self.extra_mono.get(s[i])
+
+def _double_consonant(roma_next: str) -> str:
+    if not roma_next: return ""
+    if roma_next.startswith("ch"): return "c"
+    if roma_next.startswith("sh"): return "s"
+    if roma_next.startswith("j"):  return "j"
+    if roma_next.startswith("ts"): return "t"
+    return roma_next[0]
+
+def _prolong(prev: str) -> str:
+    # 直前の末尾1文字が母音ならそれを伸ばす
+    last = prev[-1:]
+    return last if last and last in "aiueo" else ""
+
+if njit is not None:
+    @njit(cache=True)
+    def _roma_match(codes, i, n, mono, pairs):
+        # _RomajiTable.match の配列版: 位置 i からの最長一致を (消費文字数, ID or -1) で返す
+        c1 = np.int64(codes[i]) - 0x30A0
+        if c1 < 0 or c1 >= 96:
+            return 1, -1
+        if i + 1 < n:
+            c2 = np.int64(codes[i + 1]) - 0x30A0
+            if 0 <= c2 < 96 and pairs[c1 * 96 + c2] >= 0:
+                return 2, pairs[c1 * 96 + c2]
+        return 1, mono[c1]
+
+    @njit(cache=True)
+    def _literal_vowel(code):
+        # 素通しした文字が a/i/u/e/o ならその番号（ー の判定用）
+        if code == 97: return 0
+        if code == 105: return 1
+        if code == 117: return 2
+        if code == 101: return 3
+        if code == 111: return 4
+        return -1
+
+    @njit(cache=True, nogil=True)
+    def _roma_kernel(codes, starts, mono, pairs, dbl, apos, last_vowel, vowels,
+                     empty_id, n_id, n_apos_id, out, out_ends):
+        """
+        _kata_to_romaji のループを ID 列で回す版。codes には複数の文字列を連結して渡し、
+        j 番目は codes[starts[j]:starts[j + 1]]、その結果は out[out_ends[j - 1]:out_ends[j]]。
+        out の値は 0 以上ならローマ字文字列の ID、負数は ~コードポイント（素通しの文字）。
+        nogil なので、実行中も他のスレッド（Tk の画面や別の列の変換）は止まらない。
+        """
+        k = 0
+        for j in range(starts.shape[0] - 1):
+            i, n = starts[j], starts[j + 1]
+            lastv = -1  # 直前までの出力の末尾母音（0..4 = a,i,u,e,o / -1 = なし）
+            while i < n:
+                code = np.int64(codes[i])
+                if code < 0x30A0 or code > 0x30FF:
+                    out[k] = ~code; k += 1
+                    lastv = _literal_vowel(code)
+                    i += 1
+                    continue
+
+                if code == 0x30C3:  # ッ
+                    if i + 1 < n:
+                        rid = _roma_match(codes, i + 1, n, mono, pairs)[1]
+                        rid = dbl[rid] if rid >= 0 else empty_id
+                        out[k] = rid; k += 1
+                        if last_vowel[rid] != -2:
+                            lastv = last_vowel[rid]
+                    i += 1
+                    continue
+
+                if code == 0x30FC:  # ー
+                    if lastv >= 0:
+                        out[k] = vowels[lastv]; k += 1
+                    i += 1
+                    continue
+
+                size, rid = _roma_match(codes, i, n, mono, pairs)
+                if size == 1 and (rid < 0 or rid == empty_id):
+                    out[k] = ~code; k += 1
+                    lastv = -1
+                    i += 1
+                    continue
+                if size == 1 and code == 0x30F3 and rid >= 0:  # ン
+                    nid = _roma_match(codes, i + 1, n, mono, pairs)[1] if i + 1 < n else -1
+                    rid = n_apos_id if nid >= 0 and apos[nid] else n_id
+                out[k] = rid; k += 1
+                if last_vowel[rid] != -2:  # 空文字なら末尾は変わらない
+                    lastv = last_vowel[rid]
+                i += size
+            out_ends[j] = k
+else:
+    _roma_kernel = None
+
+_ASCII_VOWEL = "aiueo"
+
+class _RomajiJit:
+    """_RomajiTable を ID 配列に直したもの（numba がある場合だけ作る）"""
 
-def _kata_to_romaji(text, digraphs, mono):
+    def __init__(self, table: _RomajiTable):
+        ids: dict[str, int] = {}
+        intern = lambda v: ids.setdefault(v, len(ids))
+        self.empty_id = intern("")
+        self.mono = np.full(96, -1, np.int32)
+        self.pairs = np.full(96 * 96, -1, np.int32)
+        for c1, v in enumerate(table.mono):
+            if v is not None:
+                self.mono[c1] = intern(v)
+        for c1, row in enumerate(table.pairs):
+            for c2, v in enumerate(row or ()):
+                if v is not None:
+                    self.pairs[c1 * 96 + c2] = intern(v)
+        self.vowels = np.array([intern(v) for v in _ASCII_VOWEL], np.int32)
+        self.n_id, self.n_apos_id = intern("n"), intern("n'")
+        # ID ごとの派生値: ッ で重ねる子音 / ン の後ろで n' にするか / 末尾の母音（空文字は -2）
+        for v in list(ids):
+            intern(_double_consonant(v))
+        self.strings = tuple(ids)
+        self.dbl = np.array([ids[_double_consonant(v)] for v in self.strings], np.int32)
+        self.apos = np.array([v[:1] in ("a","i","u","e","o","y") for v in self.strings], np.bool_)
+        self.last_vowel = np.array([_ASCII_VOWEL.find(v[-1]) if v else -2
+                                    for v in self.strings], np.int8)
+
+    def many(self, texts: list[str]) -> list[str]:
+        """正規化済みの文字列をまとめて1回のカーネル呼び出しで変換する（整形前の連結結果を返す）"""
+        buf = "".join(texts)
+        codes = np.frombuffer(buf.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        starts = np.zeros(len(texts) + 1, np.int64)
+        np.cumsum([len(t) for t in texts], out=starts[1:])
+        out = np.empty(len(codes), np.int32)
+        out_ends = np.empty(len(texts), np.int64)
+        _roma_kernel(codes, starts, self.mono, self.pairs, self.dbl, self.apos, self.last_vowel,
+                     self.vowels, self.empty_id, self.n_id, self.n_apos_id, out, out_ends)
+        strings = self.strings
+        used = int(out_ends[-1]) if len(texts) else 0
+        tokens = [strings[t] if t >= 0 else chr(~t) for t in out[:used].tolist()]
+        res, k = [], 0
+        for end in out_ends.tolist():
+            res.append("".join(tokens[k:end]))
+            k = end
+        return res
+
+def _kata_to_romaji(text, table: _RomajiTable, normalized: bool = False):
+    """normalized=True なら text は _to_zen_katakana 済みとして NFKC をやり直さない"""
     if text is None:
         return None
-    s = _to_zen_katakana(text)
-
-    def double_consonant(roma_next: str) -> str:
-        if not roma_next: return ""
-        if roma_next.startswith("ch"): return "c"
-        if roma_next.startswith("sh"): return "s"
-        if roma_next.startswith("j"):  return "j"
-        if roma_next.startswith("ts"): return "t"
-        return roma_next[0]
-
-    def prolong(prev: str) -> str:
-        if not prev: return ""
-        for v in ("a","i","u","e","o"):
-            if prev.endswith(v): return v
-        return ""
+    s = text if normalized else _to_zen_katakana(text)
 
     res = []
+    last = ""  # 直前に追加した（空でない）断片。ー は末尾の母音だけを見ればよい
+    # ループ内で属性・グローバル参照を引かないようローカルに束縛しておく
+    res_append, match, _ord = res.append, table.match, ord
+    double_consonant, prolong = _double_consonant, _prolong
     i = 0
-    while i < len(s):
+    n = len(s)
+    while i < n:
         ch = s[i]
-        code = ord(ch)
+        code = _ord(ch)
         is_katakana = (0x30A0 <= code <= 0x30FF) or ch == "ー"
+        step = 1
 
         if not is_katakana:
-            res.append(ch); i += 1; continue
-
-        if ch == "ッ":
-            if i + 1 < len(s):
-                two = s[i+1:i+3]
-                roma_next = digraphs.get(two) if len(two) == 2 else None
-                if roma_next is None:
-                    roma_next = mono.get(s[i+1], "")
-                res.append(double_consonant(roma_next))
-            i += 1; continue
-
-        if ch == "ー":
-            res.append(prolong("".join(res))); i += 1; continue
-
-        two = s[i:i+2]
-        if len(two) == 2 and two in digraphs:
-            res.append(digraphs[two]); i += 2; continue
-
-        roma = mono.get(ch)
-        if roma:
-            if ch == "ン":
-                nxt = s[i+1] if i + 1 < len(s) else ""
-                nxt_roma = digraphs.get(s[i+1:i+3]) if i + 2 < len(s) else None
-                if nxt_roma is None:
-                    nxt_roma = mono.get(nxt, "")
-                res.append("n'" if nxt_roma[:1] in ("a","i","u","e","o","y") else "n")
-            else:
-                res.append(roma)
+            piece = ch
+        # ッ / ン は次のトークン（最長一致）を覗いて決める
+        elif ch == "ッ":
+            piece = double_consonant(match(s, i + 1)[1] or "") if i + 1 < n else ""
+        elif ch == "ー":
+            piece = prolong(last)
         else:
-            res.append(ch)
-        i += 1
+            step, roma = match(s, i)
+            if step == 2:
+                piece = roma
+            elif roma:
+                if ch == "ン":
+                    nxt_roma = (match(s, i + 1)[1] or "") if i + 1 < n else ""
+                    piece = "n'" if nxt_roma[:1] in ("a","i","u","e","o","y") else "n"
+                else:
+                    piece = roma
+            else:
+                piece = ch
+
+        if piece:
+            res_append(piece)
+            last = piece
+        i += step
 
     out = "".join(res).replace("-", "")
     romaji = out.lower()
     return romaji.capitalize()
 
+# 実行中のパイプラインごとのローマ字表（_romaji_cached のキーにはトークンだけを渡す）
+_romaji_tables: dict[object, _RomajiTable] = {}
+
+@lru_cache(maxsize=65536, typed=True)
+def _romaji_cached(text, token, normalized=False):
+    # 同じ姓・名は何度も出てくるので、1回の実行の中では結果を使い回す
+    return _kata_to_romaji(text, _romaji_tables[token], normalized)
+
+# カナ正規化も同じ値が繰り返し出てくるので1回の実行の中で使い回す
+# （typed=True: True と 1.0 のように == でも文字列にすると異なる値を取り違えないため）
+_kana_cached = lru_cache(maxsize=65536, typed=True)(_to_zen_katakana)
+
+def _romaji_batch(values, table: _RomajiTable) -> dict[str, str]:
+    """
+    numba がある場合に、文字列の値をまとめて1回のカーネル呼び出しでローマ字化する。
+    戻り値は 値 → 結果 の dict（文字列以外の値は含まない）
+    """
+    uniq = [v for v in dict.fromkeys(values) if isinstance(v, str)]
+    raw = table.jit.many([_to_zen_katakana(v) for v in uniq])
+    return {v: r.replace("-", "").lower().capitalize() for v, r in zip(uniq, raw)}
+
+# 全角英数記号・半角カナ・全角スペースを、NFKC で1文字になるものに限り対応する1文字へ寄せる表。
+# Cells.Replace（MatchByte 省略時）と同じく全角/半角の違いを無視して照合するために使う
+_WIDTH_FOLD = {cp: unicodedata.normalize("NFKC", chr(cp))
+               for cp in (*range(0xFF01, 0xFF5F), *range(0xFF61, 0xFFA0), 0x3000)
+               if len(unicodedata.normalize("NFKC", chr(cp))) == 1}
+
+def _fold(text: str) -> str:
+    # 照合用の形（大文字小文字・全角/半角を無視）。1文字→1文字の変換なので位置は元の文字列と揃う
+    return text.translate(_WIDTH_FOLD).lower()
+
+def _build_company_automaton(company_rules):
+    # 全ルールのパターンを1つのオートマトンにまとめる（大文字小文字・全角/半角は無視、先に出たルールを優先）
+    automaton = ahocorasick.Automaton()
+    for rule in company_rules:
+        replacement = rule.get("replacement", "")
+        for old in rule.get("patterns", []):
+            key = _fold(str(old))
+            if key and key not in automaton:
+                automaton.add_word(key, (len(key), replacement))
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+def _ac_replace(automaton, text: str) -> str:
+    low = _fold(text)
+    if len(low) != len(text):
+        # 小文字化で長さが変わる文字を含む場合は位置が合わないので触らない
+        return text
+    # 左から、同じ開始位置なら最長のものを採用して重ならないように置換
+    hits = sorted(((end - n + 1, n, repl) for end, (n, repl) in automaton.iter(low)),
+                  key=lambda h: (h[0], -h[1]))
+    if not hits:
+        return text
+    out = []
+    pos = 0
+    for start, n, repl in hits:
+        if start < pos:
+            continue
+        out.append(text[pos:start])
+        out.append(repl)
+        pos = start + n
+    out.append(text[pos:])
+    return "".join(out)
+
+def _build_company_regex(company_rules):
+    # pyahocorasick が無い場合の代わり: 全パターンを1つの正規表現にまとめる。
+    # 長いものから並べて、同じ開始位置では最長一致になるようにする（オートマトン版と同じ結果）
+    items: dict[str, str] = {}
+    for rule in company_rules:
+        replacement = rule.get("replacement", "")
+        for old in rule.get("patterns", []):
+            key = _fold(str(old))
+            if key and key not in items:
+                items[key] = replacement
+    if not items:
+        return None
+    ordered = sorted(items, key=len, reverse=True)
+    pattern = re.compile("|".join(f"({re.escape(key)})" for key in ordered))
+    replacements = [sys.intern(items[key]) for key in ordered]
+    return pattern, replacements
+
+def _regex_replace(pattern, replacements, text: str) -> str:
+    low = _fold(text)
+    if len(low) != len(text):
+        return text
+    out = []
+    pos = 0
+    for m in pattern.finditer(low):
+        out.append(text[pos:m.start()])
+        out.append(replacements[m.lastindex - 1])
+        pos = m.end()
+    if not out:
+        return text
+    out.append(text[pos:])
+    return "".join(out)
+
+def _company_replacer(company_rules):
+    """
+    会社名置換を str -> str の関数として返す（ルールが空なら None）。
+    全ルールの全パターンを1回の走査で置換する: 左から順に、同じ位置では最長のパターンを採用し、
+    置換後の文字列に対して別のパターンをもう一度当てることはしない（連鎖しない）
+    """
+    if ahocorasick is not None:
+        automaton = _build_company_automaton(company_rules)
+        return (lambda v: _ac_replace(automaton, v)) if automaton is not None else None
+    compiled = _build_company_regex(company_rules)
+    if compiled is None:
+        return None
+    pattern, replacements = compiled
+    return lambda v: _regex_replace(pattern, replacements, v)
+
+@lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int):
+    # mtime_ns はキャッシュキー用（ファイルが更新されたら読み直す）。戻り値は書き換えないこと
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+def _load_json_file(p: Path):
+    return _load_json(str(p), p.stat().st_mtime_ns)
+
+def _find_headers(grid: list[list], names) -> dict[str, tuple[int, int]]:
+    """
+    読み込み済みの grid から見出しセルの位置 (行, 列)（1始まり）を探す。
+    Cells.Find(LookAt=xlWhole) と同様に、大文字小文字を区別せず上の行から最初に一致したものを返す
+    """
+    wanted = {n.lower(): n for n in names}
+    found: dict[str, tuple[int, int]] = {}
+    for r, row in enumerate(grid, start=1):
+        for c, v in enumerate(row, start=1):
+            if isinstance(v, str):
+                name = wanted.get(v.lower())
+                if name is not None and name not in found:
+                    found[name] = (r, c)
+        if len(found) == len(wanted):
+            break
+    return found
+
+_SHEET_NAME_RE = re.compile(r'<(?:\w+:)?sheet\b[^>]*?\bname="([^"]*)"')
+
+def _xlsx_sheet_names(p: Path) -> list[str]:
+    """
+    シート名の一覧。xlsx（zip）内の xl/workbook.xml だけを読んで取り出す。
+    zip として開けない・workbook.xml が無い場合だけ openpyxl で開き直す
+    """
+    try:
+        with zipfile.ZipFile(p) as z:
+            xml = z.read("xl/workbook.xml").decode("utf-8", "ignore")
+        return [html.unescape(m) for m in _SHEET_NAME_RE.findall(xml)]
+    except (zipfile.BadZipFile, KeyError):
+        import openpyxl  # type: ignore
+        wb = openpyxl.load_workbook(p, read_only=True, data_only=True)
+        try:
+            return list(wb.sheetnames)
+        finally:
+            wb.close()
+
+# openpyxl で読み書きすると失われる要素（図形・グラフ・画像・コントロール・埋め込み・マクロ）の置き場所
+_EXCEL_ONLY_PARTS = ("xl/drawings/", "xl/activeX/", "xl/ctrlProps/", "xl/embeddings/", "xl/vbaProject.bin")
+_WORKSHEET_PART_RE = re.compile(r"xl/worksheets/[^/]+\.xml")
+# 数式（<f>）。openpyxl で保存すると計算結果がブック全体で消える。
+# 条件付き書式・入力規則・テーブル・ウィンドウ枠の固定は _copy_sheet_extras が引き継ぐので対象外
+_FORMULA_RE = re.compile(rb"<(?:\w+:)?f[\s>/]")
+
+def _xlsx_excel_loss(p: Path) -> str | None:
+    """
+    openpyxl だけで整形すると失われるものの説明（無ければ None）。
+    zip 内のパーツ名と、全シートのパーツに数式があるかだけで判定する。
+    シートの XML は少しずつ展開して最初に見つかった時点で止める。判定できない場合は Excel 側に倒す
+    """
+    try:
+        with zipfile.ZipFile(p) as z:
+            names = z.namelist()
+            if any(n.startswith(_EXCEL_ONLY_PARTS) for n in names):
+                return "図形・グラフなど"
+            for n in names:
+                if _WORKSHEET_PART_RE.fullmatch(n) and _zip_part_contains(z, n, _FORMULA_RE):
+                    return "数式の計算結果"
+            return None
+    except (zipfile.BadZipFile, KeyError, OSError):
+        return "ブックの一部（内容を判定できません）"
+
+def _zip_part_contains(z: zipfile.ZipFile, name: str, pattern: re.Pattern, chunk_size: int = 1 << 20) -> bool:
+    # チャンクの境目をまたぐ一致も拾えるよう、直前の末尾を少し残して検索する
+    tail = b""
+    with z.open(name) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return False
+            buf = tail + chunk
+            if pattern.search(buf):
+                return True
+            tail = buf[-64:]
+
+def _read_grid(rng, formulas=None) -> list[list]:
+    """
+    Range.Value2 を grid にする（単一セルだとスカラー、それ以外は行タプルのタプルが返る）。
+    数式セルは計算結果が入っていて、置換すると数式が定数で上書きされてしまうので、
+    formulas（SpecialCells(xlCellTypeFormulas) の結果）の各領域を None にして加工対象から外す。
+    grid[r - 1][c - 1] がセル (r, c) に対応する前提（rng は A1 から始まる）
+    """
+    vals = rng.Value2
+    if not isinstance(vals, tuple):
+        vals = ((vals,),)
+    grid = [list(row) for row in vals]
+    if formulas is not None:
+        n_rows, n_cols = len(grid), len(grid[0]) if grid else 0
+        for area in formulas.Areas:
+            r0, c0 = area.Row - 1, area.Column - 1
+            r1, c1 = min(r0 + area.Rows.Count, n_rows), min(c0 + area.Columns.Count, n_cols)
+            for r in range(r0, r1):
+                grid[r][c0:c1] = [None] * max(c1 - c0, 0)
+    return grid
+
+def _transform_grid(grid: list[list], romaji_table: _RomajiTable, replace_company) -> dict[int, list[int]]:
+    """
+    読み込み済みの grid（grid[r - 1][c - 1] がセル (r, c)）をその場で整形する。
+    カナ正規化 → ローマ字生成 → 会社名置換（replace_company が None なら置換しない）。
+    戻り値は 列番号 → 変更した行番号（昇順）
+    """
+    romaji_token = object()
+    _romaji_tables[romaji_token] = romaji_table
+    try:
+        # 見出しの位置も grid から求める（Cells.Find による COM 検索は使わない）
+        headers = _find_headers(grid, ("Kana_First_Orig", "Kana_Last_Orig", "Romaji_First_Orig", "Romaji_Last_Orig"))
+
+        def find_header(name: str):
+            return headers.get(name, (None, None))
+
+        # 列ごとの処理内容を先に決めておき、grid は1回だけ走査する
+        # kana: (見出し行, 列) / romaji: (見出し行, 出力列, 元の列, 元が正規化済みになる行, 事前変換した結果)
+        kana_cols = [h for h in map(find_header, ("Kana_First_Orig", "Kana_Last_Orig")) if h[0] is not None]
+        romaji_cols = []
+        targets = {"Romaji_First_Orig": "Kana_First_Orig", "Romaji_Last_Orig": "Kana_Last_Orig"}
+        for romaji_col, kana_col in targets.items():
+            hr_rom, hc_rom = find_header(romaji_col)
+            if hr_rom is None:
+                continue
+            hr_kana, hc_kana = find_header(kana_col)
+            src_hc = hc_kana if hc_kana is not None else hc_rom
+            # カナ列から作る場合、その見出しより下は同じ行のループで正規化済みの値になっている
+            norm_from = hr_kana if hc_kana is not None else len(grid)
+            romaji_cols.append((hr_rom, hc_rom, src_hc, norm_from, {}))
+        if romaji_table.jit is not None and romaji_cols:
+            # numba があれば列の値をまとめて変換しておく（キーは正規化前の値。変換結果は同じ）。
+            # カーネルは GIL を離すので、列ごとにスレッドへ振って並行に回す
+            def batch_for(col):
+                hr_rom, _, src_hc, _, _ = col
+                return _romaji_batch((grid[r][src_hc - 1] for r in range(hr_rom, len(grid))), romaji_table)
+            with ThreadPoolExecutor(max_workers=min(4, len(romaji_cols))) as pool:
+                batches = list(pool.map(batch_for, romaji_cols))
+            romaji_cols = [col[:4] + (batch,) for col, batch in zip(romaji_cols, batches)]
+
+        # 1行ごとに カナ正規化 → ローマ字生成 → 会社名置換 の順で済ませる
+        changed_rows: dict[int, list[int]] = {}
+        for r, row in enumerate(grid):
+            raw = list(row) if romaji_cols and romaji_table.jit is not None else row
+            for hr, hc in kana_cols:
+                v = row[hc - 1]
+                if r >= hr and v is not None:
+                    nv = _kana_cached(v)
+                    if nv != v:
+                        row[hc - 1] = nv
+                        changed_rows.setdefault(hc, []).append(r + 1)
+            for hr_rom, hc_rom, src_hc, norm_from, batch in romaji_cols:
+                if r < hr_rom:
+                    continue
+                src_val = row[src_hc - 1]
+                if src_val is None or str(src_val).strip() == "":
+                    continue
+                src_raw = raw[src_hc - 1]
+                if src_raw in batch:
+                    roma = batch[src_raw]
+                else:
+                    roma = _romaji_cached(src_val, romaji_token, r >= norm_from)
+                if roma is not None and roma != row[hc_rom - 1]:
+                    row[hc_rom - 1] = roma
+                    changed_rows.setdefault(hc_rom, []).append(r + 1)
+            if replace_company is not None:
+                # 全パターンを1パスで置換する（Cells.Replace をパターン数だけ呼ばない）
+                for c, v in enumerate(row, start=1):
+                    if isinstance(v, str) and v:
+                        nv = replace_company(v)
+                        if nv != v:
+                            row[c - 1] = nv
+                            rows = changed_rows.setdefault(c, [])
+                            if not rows or rows[-1] != r + 1:
+                                rows.append(r + 1)
+        return changed_rows
+    finally:
+        _romaji_tables.pop(romaji_token, None)
+        _romaji_cached.cache_clear()
+        _kana_cached.cache_clear()
+
+@lru_cache(maxsize=4)
+def _romaji_table_for(path: str, mtime_ns: int) -> _RomajiTable:
+    data = _load_json(path, mtime_ns)
+    return _RomajiTable(data.get("digraphs", {}), data.get("mono", {}))
+
+@lru_cache(maxsize=4)
+def _company_replacer_for(path: str, mtime_ns: int):
+    return _company_replacer(_load_json(path, mtime_ns))
+
+def _load_mappings(base: Path):
+    """
+    ローマ字表と会社名置換関数を返す。JSON の読み込みだけでなく表・オートマトンの構築も
+    (パス, mtime) ごとに使い回すので、2回目以降の実行ではファイルが変わらない限り作り直さない
+    """
+    romaji_p, company_p = base / ROMAJI_JSON, base / COMPANY_JSON
+    return (_romaji_table_for(str(romaji_p), romaji_p.stat().st_mtime_ns),
+            _company_replacer_for(str(company_p), company_p.stat().st_mtime_ns))
+
+def _copy_sheet_extras(wb, src, ws):
+    # copy_worksheet では引き継がれないシート設定を移す
+    if src.print_area:
+        ws.print_area = [a.split("!", 1)[-1] for a in src.print_area.split(",")]
+    ws.print_title_rows = src.print_title_rows
+    ws.print_title_cols = src.print_title_cols
+    ws.freeze_panes = src.freeze_panes
+    for cf in src.conditional_formatting:
+        for rule in cf.rules:
+            ws.conditional_formatting.add(str(cf.sqref), copy.copy(rule))
+    for dv in src.data_validations.dataValidation:
+        ws.add_data_validation(copy.deepcopy(dv))
+    # テーブル名はブック内で一意でなければならないので、シート名を付けて重複を避ける
+    used = {name for sheet in wb.worksheets for name in sheet.tables}
+    for table in src.tables.values():
+        name, n = f"{table.name}_{OUTPUTS_SHEET}", 2
+        while name in used:
+            name, n = f"{table.name}_{OUTPUTS_SHEET}{n}", n + 1
+        used.add(name)
+        new = copy.deepcopy(table)
+        new.name = new.displayName = name
+        ws.add_table(new)
+
+def _run_openpyxl_pipeline(input_path: Path, base: Path, output_path: Path):
+    """
+    Excel を起動せず openpyxl だけで整形する（COM の往復が無いぶん速い）。
+    DATA を copy_worksheet で複製して Outputs にする。値・書式・列幅・行の高さ・結合・ページ設定は
+    copy_worksheet が、印刷範囲・印刷タイトル・条件付き書式・入力規則・テーブル・ウィンドウ枠の固定は
+    _copy_sheet_extras が引き継ぐ。
+    図形・グラフなど openpyxl が扱えないものは保存時に失われる（_xlsx_excel_loss で判定できる）。
+    また openpyxl で保存すると数式の計算結果（キャッシュ値）は DATA を含むブック全体で消え、
+    Excel で開き直して再計算するまで値を持たない
+    """
+    try:
+        import openpyxl  # type: ignore
+    except ImportError:
+        raise RuntimeError("openpyxl が必要です。\n pip install openpyxl")
+
+    romaji_table, replace_company = _load_mappings(base)
+
+    wb = openpyxl.load_workbook(input_path)
+    try:
+        if DATA_SHEET not in wb.sheetnames:
+            raise RuntimeError("シート 'DATA' が見つかりません。")
+        if OUTPUTS_SHEET in wb.sheetnames:
+            del wb[OUTPUTS_SHEET]
+        src = wb[DATA_SHEET]
+        ws = wb.copy_worksheet(src)
+        ws.title = OUTPUTS_SHEET
+        _copy_sheet_extras(wb, src, ws)
+
+        # iter_rows でまとめて読む（ws.cell を1セルずつ呼ばない）。
+        # 数式セルは式の文字列が入っているので、加工対象から外すため None にしておく
+        grid = [[None if cell.data_type == "f" else cell.value for cell in row]
+                for row in ws.iter_rows(min_row=1, min_col=1)]
+        changed_rows = _transform_grid(grid, romaji_table, replace_company)
+        for c, rows in changed_rows.items():
+            for r in rows:
+                ws.cell(row=r, column=c).value = grid[r - 1][c - 1]
+
+        wb.save(output_path)
+    finally:
+        wb.close()
+
 def _run_excel_pipeline(input_path: Path, base: Path, output_path: Path):
     if win32 is None:
         raise RuntimeError("pywin32 / win32com が使用できません。Windows + Excel + pywin32 を確認してください。")
 
-    with open(base / ROMAJI_JSON, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    digraphs, mono = data.get("digraphs", {}), data.get("mono", {})
-
-    with open(base / COMPANY_JSON, "r", encoding="utf-8") as f:
-        company_rules = json.load(f)
+    romaji_table, replace_company = _load_mappings(base)
 
     FILE_PATH = Path(input_path)
     SHEET_SRC = DATA_SHEET
     SHEET_DST = OUTPUTS_SHEET
 
     # Excel const
-    xlValues = -4163
-    xlWhole  = 1
-    xlPart   = 2
-    xlByRows = 1
-
-    def find_header(ws, name: str):
-        found = ws.Cells.Find(What=name, LookIn=xlValues, LookAt=xlWhole)
-        if found is None:
-            return None, None
-        return found.Row, found.Column
+    xlCalculationManual    = -4135
+    xlCalculationAutomatic = -4105
+    xlOpenXMLWorkbook      = 51
+    xlCellTypeFormulas     = -4123
 
     excel = win32.DispatchEx("Excel.Application")
     excel.Visible = False
     excel.DisplayAlerts = False
 
+    prev_calc = xlCalculationAutomatic
     try:
         wb = excel.Workbooks.Open(str(FILE_PATH))
 
+        # 大量の書き込み中は再計算・再描画・イベントを止める（Calculation はブックを開いた後でないと設定できない）
+        # 元の計算方法（開いたブックの設定）は覚えておき、保存前に戻す
+        excel.ScreenUpdating = False
+        excel.EnableEvents = False
+        prev_calc = excel.Calculation
+        excel.Calculation = xlCalculationManual
+
         try:
             ws_src = wb.Worksheets(SHEET_SRC)
         except Exception:
             raise RuntimeError("シート 'DATA' が見つかりません。")
 
+        # DATA シートを丸ごと複製して Outputs にする（書式・列幅・行の高さ・ページ設定・印刷範囲も
+        # Excel 側で一度にコピーされるので、Copy/PasteSpecial や属性ごとの転記は要らない）
         try:
-            ws_dst = wb.Worksheets(SHEET_DST)
+            wb.Worksheets(SHEET_DST).Delete()
         except Exception:
-            ws_dst = wb.Worksheets.Add(After=wb.Worksheets(wb.Worksheets.Count))
-            ws_dst.Name = SHEET_DST
-
-        ws_dst.Cells.Clear()
-        ws_src.UsedRange.Copy()
-        ws_dst.Range("A1").PasteSpecial(-4104)  # xlPasteAll
+            pass
+        ws_src.Copy(After=wb.Worksheets(wb.Worksheets.Count))
+        ws_dst = wb.Worksheets(wb.Worksheets.Count)
+        ws_dst.Name = SHEET_DST
 
-        src_ur = ws_src.UsedRange
-        for i in range(1, src_ur.Columns.Count + 1):
-            ws_dst.Columns(i).ColumnWidth = ws_src.Columns(i).ColumnWidth
-        for r in range(1, src_ur.Rows.Count + 1):
-            ws_dst.Rows(r).RowHeight = ws_src.Rows(r).RowHeight
+        used = ws_dst.UsedRange
+        last_row = used.Row + used.Rows.Count - 1
+        last_col = used.Column + used.Columns.Count - 1
 
+        # シートの値を1回の COM 呼び出しでまとめて読み、加工は Python 側で行う
+        # grid[r - 1][c - 1] がセル (r, c) に対応
+        # 数式セルの位置は SpecialCells でまとめて取る（数式が1つも無いと例外になる）
         try:
-            sps, dps = ws_src.PageSetup, ws_dst.PageSetup
-            for a in ("Orientation","Zoom","FitToPagesWide","FitToPagesTall",
-                      "LeftMargin","RightMargin","TopMargin","BottomMargin",
-                      "HeaderMargin","FooterMargin","CenterHorizontally","CenterVertically",
-                      "PrintTitleRows","PrintTitleColumns"):
-                try: setattr(dps, a, getattr(sps, a))
-                except Exception: pass
-            try:
-                pa = sps.PrintArea
-                if pa and "!" in pa: pa = pa.split("!",1)[1]
-                if pa: dps.PrintArea = pa
-            except Exception: pass
+            formulas = used.SpecialCells(xlCellTypeFormulas)
         except Exception:
-            pass
+            formulas = None
+        grid = _read_grid(ws_dst.Range(ws_dst.Cells(1, 1), ws_dst.Cells(last_row, last_col)), formulas)
 
-        used = ws_dst.UsedRange
-        last_row = used.Row + used.Rows.Count - 1
+        def write_column(hc: int, rows: list[int]):
+            # 変更のあった行（昇順）を連続する区間にまとめ、区間ごとに1回で書き戻す。
+            # 変更していないセルは書き直さない（数式・数値や日付に見える文字列・リッチテキストを壊さない）
+            for _, run in groupby(enumerate(rows), key=lambda x: x[1] - x[0]):
+                run = [r for _, r in run]
+                ws_dst.Range(ws_dst.Cells(run[0], hc), ws_dst.Cells(run[-1], hc)).Value2 = \
+                    tuple((grid[r - 1][hc - 1],) for r in run)
 
-        for col_name in ("Kana_First_Orig", "Kana_Last_Orig"):
-            hr, hc = find_header(ws_dst, col_name)
-            if hr is None:
-                continue
-            for r in range(hr + 1, last_row + 1):
-                cell = ws_dst.Cells(r, hc)
-                v = cell.Value
-                nv = _to_zen_katakana(v) if v is not None else v
-                if nv != v:
-                    cell.Value = nv
+        changed_rows = _transform_grid(grid, romaji_table, replace_company)
 
-        targets = {"Romaji_First_Orig": "Kana_First_Orig", "Romaji_Last_Orig": "Kana_Last_Orig"}
-        for romaji_col, kana_col in targets.items():
-            hr_rom, hc_rom = find_header(ws_dst, romaji_col)
-            if hr_rom is None:
-                continue
-            hr_kana, hc_kana = find_header(ws_dst, kana_col)
-            src_hc = hc_kana if hc_kana is not None else hc_rom
-            for r in range(hr_rom + 1, last_row + 1):
-                src_val = ws_dst.Cells(r, src_hc).Value
-                if src_val is None or str(src_val).strip() == "":
-                    continue
-                roma = _kata_to_romaji(src_val, digraphs, mono)
-                cur  = ws_dst.Cells(r, hc_rom).Value
-                if roma is not None and roma != cur:
-                    ws_dst.Cells(r, hc_rom).Value = roma
-
-        for rule in company_rules:
-            patterns = rule.get("patterns", [])
-            replacement = rule.get("replacement", "")
-            for old in patterns:
-                ws_dst.Cells.Replace(
-                    What=old,
-                    Replacement=replacement,
-                    LookAt=xlPart,
-                    SearchOrder=xlByRows,
-                    MatchCase=False,
-                    SearchFormat=False,
-                    ReplaceFormat=False
-                )
-
-        wb.SaveCopyAs(str(output_path))
+        # 変わった列だけ書き戻す
+        for hc, rows in sorted(changed_rows.items()):
+            write_column(hc, rows)
+
+        # 計算方法はブックにも保存されるため、保存前に元へ戻しておく
+        excel.Calculation = prev_calc
+        # SaveCopyAs はブックの複製を書き出すので、開いているブックをそのまま別名保存する
+        # （元ファイルは Close(SaveChanges=False) で変更されない）
+        wb.SaveAs(str(output_path), FileFormat=xlOpenXMLWorkbook)
 
     finally:
+        try:
+            excel.Calculation = prev_calc
+            excel.EnableEvents = True
+            excel.ScreenUpdating = True
+        except Exception:
+            pass
         try:
             wb.Close(SaveChanges=False)
         except Exception:
@@ -281,6 +837,10 @@ class Plugin(PluginBase):
         self.btn_run = None
         self.drop_label = None
         self.log = None
+        self.var_use_excel = None
+        # ログはまとめて書き込む（Text への insert / see は 100ms ごとに1回）
+        self._log_buf: deque[str] = deque(maxlen=2000)
+        self._log_after = None
 
     # ---- Tk（デスクトップ）用 UI ----
     def mount(self, parent):
@@ -319,6 +879,12 @@ class Plugin(PluginBase):
         self.drop_label.pack(fill="x")
         drop.bind("<Button-1>", lambda e: self._on_browse_file())
         ttk.Button(card2, text="🔎 ファイルを選択", command=self._on_browse_file).pack(anchor="e")
+        # 外すと openpyxl だけで処理する（速いが図形・グラフや数式の計算結果は保持されない）。
+        # ファイル選択時に、openpyxl では失われるものを含むかどうかで自動的に切り替える
+        self.var_use_excel = tk.BooleanVar(value=win32 is not None)
+        ttk.Checkbutton(card2, text="Excel で処理する（外すと openpyxl: 図形・グラフと数式の計算結果は保存されません）",
+                        variable=self.var_use_excel,
+                        state="normal" if win32 is not None else "disabled").pack(anchor="e", pady=(6, 0))
         self.btn_run = ttk.Button(card2, text="▶ データ整形を実行", command=self._on_run, state="disabled")
         self.btn_run.pack(anchor="e", pady=(6, 0))
 
@@ -340,7 +906,8 @@ class Plugin(PluginBase):
             "  - `Attendee_format_original.xlsx`\n"
             "  - `romaji_mapping.json`\n"
             "  - `company_replacements.json`\n"
-            "- `pip install pywin32 openpyxl`\n"
+            "- `pip install pywin32 openpyxl`（任意で `pyahocorasick` を入れると会社名置換が速くなります）\n"
+            "- Excel が無い場合は openpyxl だけで整形できます（図形・グラフと数式の計算結果は保持されません）\n"
             "- プラグインで Excel を選択 → 整形 → 別名保存"
         )
         st.subheader("配置チェック")
@@ -351,6 +918,12 @@ class Plugin(PluginBase):
         })
 
     def unmount(self) -> None:
+        if self._log_after is not None and self.log is not None:
+            try: self.log.after_cancel(self._log_after)
+            except Exception: pass
+        self._log_after = None
+        self._log_buf.clear()
+        self.log = None
         if self.root and hasattr(self.root, "winfo_exists") and self.root.winfo_exists():
             self.root.destroy()
         self.root = None
@@ -390,9 +963,7 @@ class Plugin(PluginBase):
             return
         p = Path(f)
         try:
-            import openpyxl  # type: ignore
-            wb = openpyxl.load_workbook(p, read_only=True, data_only=True)
-            if DATA_SHEET not in wb.sheetnames:
+            if DATA_SHEET not in _xlsx_sheet_names(p):
                 if messagebox: messagebox.showwarning(self.name, f"シート '{DATA_SHEET}' が見つかりません。")
                 return
         except Exception as e:
@@ -402,9 +973,26 @@ class Plugin(PluginBase):
         self.selected_file = p
         if self.drop_label:
             self.drop_label.configure(text=f"選択中: {p.name}")
+        self._log(f"選択: {p}", "ok")
+
+        # 図形・グラフや数式が無ければ Excel を起動しない openpyxl で十分。
+        # 判定はシートの XML を展開するので、大きいブックでも画面が止まらないよう別スレッドで行う
+        # （判定が終わるまで実行ボタンは押せない）
         if self.btn_run:
+            self.btn_run.configure(state="disabled")
+        root = self.root
+        threading.Thread(target=lambda: self._post(root, self._on_probe_done, p, _xlsx_excel_loss(p)),
+                         daemon=True).start()
+
+    def _on_probe_done(self, p: Path, loss: str | None):
+        if not self.root or p != self.selected_file:
+            return  # 画面を閉じた・判定中に別のファイルを選び直した
+        if self.var_use_excel is not None:
+            self.var_use_excel.set(loss is not None and win32 is not None)
+        if loss is not None and win32 is None:
+            self._log(f"Excel が使えないため、openpyxl での整形では{loss}が失われます", "error")
+        if self.btn_run and hasattr(self.btn_run, "configure"):
             self.btn_run.configure(state="normal")
-        self._log(f"選択: {p}", "ok")
 
     def _on_run(self):
         if self.selected_file is None:
@@ -413,7 +1001,8 @@ class Plugin(PluginBase):
         if missing:
             if messagebox: messagebox.showerror(self.name, f"必要ファイルが見つかりません：{', '.join(missing)}")
             return
-        if win32 is None:
+        use_excel = bool(self.var_use_excel is not None and self.var_use_excel.get())
+        if use_excel and win32 is None:
             if messagebox: messagebox.showerror(self.name, "pywin32 が必要です。\n pip install pywin32")
             return
 
@@ -431,19 +1020,51 @@ class Plugin(PluginBase):
             self._log("保存先の指定をキャンセル", "info")
             return
 
+        if self.btn_run and hasattr(self.btn_run, "configure"): self.btn_run.configure(state="disabled")
+        if self.root and hasattr(self.root, "config"): self.root.config(cursor="watch")
+        self._log(f"データ整形を開始...（{'Excel' if use_excel else 'openpyxl'}）", "info")
+        # Excel の処理は数分かかることがあるので別スレッドで回し、結果だけ Tk 側に戻す
+        threading.Thread(target=self._run_worker, args=(self.selected_file, Path(out), self.root, use_excel),
+                         daemon=True).start()
+
+    def _run_worker(self, src: Path, out: Path, root, use_excel: bool):
+        # COM はスレッドごとに初期化が必要（DispatchEx をこのスレッドから呼ぶため）
+        if use_excel:
+            pythoncom.CoInitialize()
         try:
-            if self.btn_run and hasattr(self.btn_run, "configure"): self.btn_run.configure(state="disabled")
-            if self.root and hasattr(self.root, "config"): self.root.config(cursor="watch")
-            self._log("データ整形を開始...", "info")
-            _run_excel_pipeline(self.selected_file, self.base, Path(out))
-            self._log(f"完了: {out}", "ok")
-            if messagebox: messagebox.showinfo(self.name, f"整形が完了しました。\n\n{out}")
+            pipeline = _run_excel_pipeline if use_excel else _run_openpyxl_pipeline
+            pipeline(src, self.base, out)
         except Exception as e:
-            self._log(f"整形に失敗: {e}", "error")
-            if messagebox: messagebox.showerror(self.name, f"整形に失敗しました。\n{e}")
+            self._post(root, self._on_run_failed, e)
+        else:
+            self._post(root, self._on_run_done, out)
         finally:
-            if self.root and hasattr(self.root, "config"): self.root.config(cursor="")
-            if self.btn_run and hasattr(self.btn_run, "configure"): self.btn_run.configure(state="normal")
+            if use_excel:
+                pythoncom.CoUninitialize()
+
+    @staticmethod
+    def _post(root, fn, *args):
+        # ワーカースレッドから Tk スレッドへ戻す（画面が閉じられていれば結果は捨てる）
+        try:
+            root.after(0, fn, *args)
+        except Exception:
+            pass
+
+    def _on_run_done(self, out: Path):
+        self._end_run()
+        self._log(f"完了: {out}", "ok")
+        if messagebox: messagebox.showinfo(self.name, f"整形が完了しました。\n\n{out}")
+
+    def _on_run_failed(self, e: Exception):
+        self._end_run()
+        self._log(f"整形に失敗: {e}", "error")
+        if messagebox: messagebox.showerror(self.name, f"整形に失敗しました。\n{e}")
+
+    def _end_run(self):
+        if not self.root:
+            return  # 実行中に画面を閉じた場合
+        if hasattr(self.root, "config"): self.root.config(cursor="")
+        if self.btn_run and hasattr(self.btn_run, "configure"): self.btn_run.configure(state="normal")
 
     # ===== 共通 =====
     def _status_text(self) -> str:
@@ -456,8 +1077,16 @@ class Plugin(PluginBase):
         # Tk ログ欄が無い場合は何もしない（Webでは未使用）
         if not self.log:
             return
-        from datetime import datetime
         now = datetime.now().strftime("%H:%M:%S")
         tags = {"info": "[i]", "ok": "[✓]", "error": "[!]", "ready": "[•]"}
-        self.log.insert("end", f"{now} {tags.get(level,'[ ]')} {msg}\n")
+        self._log_buf.append(f"{now} {tags.get(level,'[ ]')} {msg}\n")
+        if self._log_after is None:
+            self._log_after = self.log.after(100, self._flush_log)
+
+    def _flush_log(self):
+        self._log_after = None
+        if not self.log or not self._log_buf:
+            return
+        self.log.insert("end", "".join(self._log_buf))
+        self._log_buf.clear()
         self.log.see("end")